@@ -3,7 +3,7 @@
 """Dataset analysis utilities."""
 
 import logging
-from typing import Callable, Collection, Optional, Tuple, Union
+from typing import Callable, Collection, Mapping, Optional, Tuple, Union
 
 import pandas as pd
 import torch
@@ -23,6 +23,8 @@ __all__ = [
     # relation typing
     "get_relation_pattern_types_df",
     "get_relation_cardinality_types_df",
+    # registry
+    "ANALYSIS_FUNCS",
 ]
 
 # constants
@@ -398,3 +400,15 @@ def get_relation_functionality_df(
         add_labels=add_labels,
         label_to_id=dataset.relation_to_id,
     )
+
+
+#: A mapping from analysis keys to the functions computing the corresponding dataframe from a dataset
+ANALYSIS_FUNCS: Mapping[str, Callable[..., pd.DataFrame]] = {
+    "relation_count": get_relation_count_df,
+    "entity_count": get_entity_count_df,
+    "entity_relation_co_occurrence": get_entity_relation_co_occurrence_df,
+    "relation_pattern_types": get_relation_pattern_types_df,
+    "relation_cardinality_types": get_relation_cardinality_types_df,
+    "relation_injectivity": get_relation_injectivity_df,
+    "relation_functionality": get_relation_functionality_df,
+}
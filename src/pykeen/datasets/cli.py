@@ -4,12 +4,16 @@
 
 import itertools as itt
 import logging
+import operator
 import pathlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
-from typing import Union
+from typing import DefaultDict, List, Union
 
 import click
 import docdata
+import numpy
 import pandas as pd
 from more_click import verbose_option
 from tqdm import tqdm
@@ -36,17 +40,23 @@ def summarize():
             click.secho(str(e), fg="red", bold=True)
 
 
+def _get_num_triples(dataset) -> int:
+    return docdata.get_docdata(dataset)["statistics"]["triples"]
+
+
 def _iter_datasets(regex_name_filter=None):
-    it = sorted(
-        dataset_resolver.lookup_dict.items(),
-        key=lambda pair: docdata.get_docdata(pair[1])["statistics"]["triples"],
-    )
+    it = list(dataset_resolver.lookup_dict.items())
+    # filter first, such that the documentation only has to be parsed for the selected datasets
     if regex_name_filter is not None:
         if isinstance(regex_name_filter, str):
             import re
 
             regex_name_filter = re.compile(regex_name_filter)
         it = [(name, dataset) for name, dataset in it if regex_name_filter.match(name)]
+    # look up the number of triples once per dataset (concurrently), and sort by it
+    with ThreadPoolExecutor() as executor:
+        sizes = list(executor.map(_get_num_triples, (dataset for _, dataset in it)))
+    it = [pair for _, pair in sorted(zip(sizes, it), key=operator.itemgetter(0))]
     it = tqdm(
         it,
         desc="Datasets",
@@ -103,18 +113,15 @@ def _analyze(dataset, force, countplots, directory: Union[None, str, pathlib.Pat
     d.mkdir(parents=True, exist_ok=True)
 
     dfs = {}
-    it = tqdm(analysis.__dict__.items(), leave=False, desc="Stats")
-    for name, func in it:
-        if not name.startswith("get") or not name.endswith("df"):
-            continue
-        it.set_postfix(func=name)
-        key = name[len("get_") : -len("_df")]
-        path = d.joinpath(key).with_suffix(".tsv")
+    it = tqdm(analysis.ANALYSIS_FUNCS.items(), leave=False, desc="Stats")
+    for key, func in it:
+        it.set_postfix(func=func.__name__)
+        path = d.joinpath(f"{key}.tsv.gz")
         if path.exists() and not force:
-            df = pd.read_csv(path, sep="\t")
+            df = pd.read_csv(path, sep="\t", compression="gzip", engine="c")
         else:
             df = func(dataset=dataset_instance)
-            df.to_csv(d.joinpath(key).with_suffix(".tsv"), sep="\t", index=False)
+            df.to_csv(path, sep="\t", index=False, compression="gzip")
         dfs[key] = df
 
     fig, ax = plt.subplots(1, 1)
@@ -172,36 +179,22 @@ def _analyze(dataset, force, countplots, directory: Union[None, str, pathlib.Pat
 @click.option("--dataset", help="Regex for filtering datasets by name")
 def verify(dataset: str):
     """Verify dataset integrity."""
-    data = []
-    keys = None
+    columns: DefaultDict[str, List[Union[str, int]]] = defaultdict(list)
     for name, dataset in _iter_datasets(regex_name_filter=dataset):
         dataset_instance = get_dataset(dataset=dataset)
-        data.append(
-            list(
-                itt.chain(
-                    [name],
-                    itt.chain.from_iterable(
-                        (triples_factory.num_entities, triples_factory.num_relations)
-                        for _, triples_factory in sorted(dataset_instance.factory_dict.items())
-                    ),
-                )
-            )
-        )
-        keys = keys or sorted(dataset_instance.factory_dict.keys())
-    if not keys:
+        columns["name"].append(name)
+        for part, triples_factory in sorted(dataset_instance.factory_dict.items()):
+            columns[f"num_{part}_entities"].append(triples_factory.num_entities)
+            columns[f"num_{part}_relations"].append(triples_factory.num_relations)
+    if not columns:
         return
-    df = pd.DataFrame(
-        data=data,
-        columns=["name"] + [f"num_{part}_{a}" for part in keys for a in ("entities", "relations")],
-    )
-    valid = None
-    for part, a in itt.product(("validation", "testing"), ("entities", "relations")):
-        this_valid = df[f"num_training_{a}"] == df[f"num_{part}_{a}"]
-        if valid is None:
-            valid = this_valid
-        else:
-            valid = valid & this_valid
-    df["valid"] = valid
+    df = pd.DataFrame(columns)
+    # the number of entities and relations of the evaluation parts has to match the one of the training part
+    training_values = df[[f"num_training_{a}" for a in ("entities", "relations")]].values
+    evaluation_values = df[
+        [f"num_{part}_{a}" for part, a in itt.product(("validation", "testing"), ("entities", "relations"))]
+    ].values
+    df["valid"] = (evaluation_values == numpy.tile(training_values, 2)).all(axis=1)
     click.echo(df.to_markdown())
 
 
@@ -94,17 +94,15 @@ def run_inverse_stability_workflow(dataset: str, model: str, training_loop: str,
     scores_inverse_np = scores_inverse.detach().numpy()[:, 0]
 
     scores_path = dataset_dir / f"{model_name}_{training_loop}_scores.tsv"
+    # build column-wise from the score arrays; the scalar columns are broadcast
     df = pd.DataFrame(
-        list(
-            zip(
-                itt.repeat(training_loop),
-                itt.repeat(dataset_name),
-                itt.repeat(model_name),
-                scores_forward_np,
-                scores_inverse_np,
-            )
-        ),
-        columns=["training_loop", "dataset", "model", "forward", "inverse"],
+        {
+            "training_loop": training_loop,
+            "dataset": dataset_name,
+            "model": model_name,
+            "forward": scores_forward_np,
+            "inverse": scores_inverse_np,
+        },
     )
     df.to_csv(scores_path, sep="\t", index=False)
 
@@ -11,6 +11,7 @@ from sklearn.preprocessing import normalize as sklearn_normalize
 
 __all__ = [
     "get_csr_matrix",
+    "get_dense_rows",
     "marginal_score",
 ]
 
@@ -27,7 +28,21 @@ def get_csr_matrix(
         shape=shape,
     ).tocsr()
     # normalize to relative counts
-    return sklearn_normalize(matrix, norm="l1")
+    return sklearn_normalize(matrix, norm="l1", copy=False)
+
+
+def get_dense_rows(
+    matrix: scipy.sparse.csr_matrix,
+    indices: numpy.ndarray,
+) -> numpy.ndarray:
+    """Get the given rows of a sparse matrix as dense float32 array.
+
+    Each distinct row is only gathered and densified once, in sorted order, and then repeated by a dense lookup.
+    This is beneficial for batches with many repeated indices, e.g., relations. For (mostly) distinct indices, e.g.,
+    entities, the additional sort and dense copy make it slower than directly gathering the rows.
+    """
+    unique_indices, inverse = numpy.unique(indices, return_inverse=True)
+    return matrix[unique_indices].astype(numpy.float32, copy=False).toarray()[inverse]
 
 
 def marginal_score(
@@ -43,20 +58,25 @@ def marginal_score(
     if per_entity is None and per_relation is None:
         return torch.full(size=(batch_size, num_entities), fill_value=1 / num_entities)
 
+    # the sparse matrices live on CPU, so only the indices have to be moved there. For CPU tensors, .cpu() returns
+    # the tensor itself, and .numpy() a view, i.e., no copy is made
     e, r = entity_relation_batch.cpu().numpy().T
 
+    # note: we need to work with dense arrays only to comply with returning torch tensors. Otherwise, we could
+    # stay sparse here, with a potential of a huge memory benefit on large datasets!
     if per_relation is not None and per_entity is None:
-        scores = per_relation[r]
+        scores = get_dense_rows(matrix=per_relation, indices=r)
     elif per_relation is None and per_entity is not None:
-        scores = per_entity[e]
+        # entity indices are mostly distinct, so de-duplication does not pay off
+        scores = per_entity[e].astype(numpy.float32, copy=False).toarray()
     elif per_relation is not None and per_entity is not None:
         e_score = per_entity[e]
         r_score = per_relation[r]
         scores = e_score.multiply(r_score)
         scores = sklearn_normalize(scores, norm="l1", axis=1)
+        # note: toarray returns a plain ndarray rather than a numpy.matrix; we keep float32 to match torch's default
+        scores = scores.astype(numpy.float32, copy=False).toarray()
     else:
         raise AssertionError  # for mypy
 
-    # note: we need to work with dense arrays only to comply with returning torch tensors. Otherwise, we could
-    # stay sparse here, with a potential of a huge memory benefit on large datasets!
-    return torch.from_numpy(scores.todense())
+    return torch.from_numpy(scores)
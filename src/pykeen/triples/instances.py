@@ -148,7 +148,7 @@ class LCWAInstances(Instances[LCWABatchType]):
         return self.pairs.shape[0]
 
     def __getitem__(self, item: int) -> LCWABatchType:  # noqa: D105
-        return self.pairs[item], np.asarray(self.compressed[item, :].todense())[0, :]
+        return self.pairs[item], self.compressed[item, :].toarray()[0, :]
 
 
 class MultimodalInstances:
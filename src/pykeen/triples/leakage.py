@@ -102,11 +102,99 @@ def jaccard_similarity_scipy(
     :return: shape: (m, n)
         The pairwise Jaccard similarity.
     """
-    sum_size = numpy.asarray(a.sum(axis=1) + b.sum(axis=1).T)
-    intersection_size = numpy.asarray((a @ b.T).todense())
+    # the intersection size buffer is re-used for the similarity, and the union size is computed in-place, such that
+    # only two dense (m, n) arrays are allocated
+    sim = (a @ b.T).toarray().astype(numpy.float64, copy=False)
+    union_size = numpy.add(numpy.asarray(a.sum(axis=1), dtype=numpy.float64), numpy.asarray(b.sum(axis=1)).T)
+    union_size -= sim
     # safe division for empty sets
-    divisor = numpy.clip(sum_size - intersection_size, a_min=1, a_max=None)
-    return intersection_size / divisor
+    numpy.clip(union_size, a_min=1, a_max=None, out=union_size)
+    return numpy.divide(sim, union_size, out=sim)
+
+
+def jaccard_similarity_sparse(
+    a: scipy.sparse.spmatrix,
+    b: Optional[scipy.sparse.spmatrix],
+    threshold: float,
+    block_size: int = 256,
+    stacked: bool = False,
+) -> scipy.sparse.csr_matrix:
+    r"""Compute the Jaccard similarity between sets, keeping only entries of at least the given threshold.
+
+    In contrast to :func:`jaccard_similarity_scipy`, the intersection size is kept as sparse matrix, and the
+    similarity is only computed for pairs of sets with non-empty intersection. Thus, no dense array of shape
+    $(m, n)$ is ever allocated. Moreover, the first sets are processed in blocks, and each block's similarities are
+    pruned by the threshold right away, such that only the surviving entries are kept in memory.
+
+    :param a: shape: (m, max_num_elements)
+        The first sets.
+    :param b: shape: (n, max_num_elements)
+        The second sets. If None, the similarity of the first sets to themselves is computed. Since this similarity
+        is symmetric, only its upper triangle is computed, and mirrored afterwards.
+    :param threshold:
+        The threshold above which the similarity has to be. Must be positive, since pairs with empty intersection
+        (i.e., similarity of zero) are not considered.
+    :param block_size:
+        The number of first sets processed at once.
+    :param stacked:
+        Whether the first $m$ of the second sets are the first sets, i.e., ``b = scipy.sparse.vstack([a, c])``. In
+        this case, only the upper triangle of the similarities between the first sets and this part of the second
+        sets is computed, and mirrored afterwards, as if ``b`` were ``None``.
+
+    :return: shape: (m, n)
+        The pairwise Jaccard similarity as sparse matrix, containing only entries of at least the threshold.
+
+    :raises ValueError:
+        If the threshold is not positive.
+    """
+    if threshold <= 0:
+        raise ValueError(f"threshold must be positive, but is {threshold}")
+    a = a.tocsr()
+    a_size = numpy.asarray(a.sum(axis=1)).ravel()
+    if b is None:
+        b, b_size, stacked = a, a_size, True
+    else:
+        b = b.tocsr()
+        b_size = numpy.asarray(b.sum(axis=1)).ravel()
+    # the number of second sets whose similarity to the first sets is symmetric
+    num_symmetric = a.shape[0] if stacked else 0
+    starts = range(0, a.shape[0], block_size)
+    # transpose the second sets only once (to CSR, as otherwise scipy converts them for every product). The symmetric
+    # part is split into column blocks aligned with the row blocks, such that the blocks below the diagonal can be
+    # skipped
+    b_t_blocks = (
+        [(start, b[start : min(start + block_size, num_symmetric)].T.tocsr()) for start in starts] if stacked else []
+    )
+    if num_symmetric < b.shape[0]:
+        b_t_blocks.append((num_symmetric, b[num_symmetric:].T.tocsr()))
+    rows, cols, sims = [], [], []
+    for start in starts:
+        a_block = a[start : start + block_size]
+        for offset, b_t in b_t_blocks:
+            if offset < min(start, num_symmetric):
+                # a block of the symmetric part below the diagonal
+                continue
+            intersection = (a_block @ b_t).tocoo()
+            block_rows, block_cols = intersection.row + start, intersection.col + offset
+            # the union is non-empty for pairs with non-empty intersection
+            sim = intersection.data / (a_size[block_rows] + b_size[block_cols] - intersection.data)
+            mask = sim >= threshold
+            if offset < num_symmetric:
+                # within the diagonal blocks, only keep the upper triangle
+                mask &= block_cols >= block_rows
+            rows.append(block_rows[mask])
+            cols.append(block_cols[mask])
+            sims.append(sim[mask])
+    shape = (a.shape[0], b.shape[0])
+    if not rows:
+        return scipy.sparse.csr_matrix(shape)
+    row, col, sim = numpy.concatenate(rows), numpy.concatenate(cols), numpy.concatenate(sims)
+    if stacked:
+        # mirror the strict upper triangle of the symmetric part
+        off_diagonal = (row != col) & (col < num_symmetric)
+        row, col = numpy.concatenate([row, col[off_diagonal]]), numpy.concatenate([col, row[off_diagonal]])
+        sim = numpy.concatenate([sim, sim[off_diagonal]])
+    return scipy.sparse.csr_matrix((sim, (row, col)), shape=shape)
 
 
 def triples_factory_to_sparse_matrices(
@@ -164,15 +252,10 @@ def mapped_triples_to_sparse_matrices(
         head-tail-set, tail-head-set matrices as {0, 1} integer matrices.
     """
     num_triples = mapped_triples.shape[0]
-    # compute unique pairs in triples *and* inverted triples for consistent pair-to-id mapping
-    extended_mapped_triples = torch.cat(
-        [
-            mapped_triples,
-            mapped_triples.flip(-1),
-        ],
-        dim=0,
-    )
-    pairs, pair_id = extended_mapped_triples[:, [0, 2]].unique(dim=0, return_inverse=True)
+    # compute unique pairs in triples *and* inverted triples for consistent pair-to-id mapping. only the entity
+    # columns are gathered, rather than concatenating full (inverted) triples and selecting the columns afterwards
+    head_tail = mapped_triples[:, [0, 2]]
+    pairs, pair_id = torch.cat([head_tail, head_tail.flip(-1)], dim=0).unique(dim=0, return_inverse=True)
     n_pairs = pairs.shape[0]
     forward, backward = pair_id.split(num_triples)
     relations = mapped_triples[:, 1]
@@ -187,8 +270,12 @@ def get_candidate_pairs(
     b: Optional[scipy.sparse.spmatrix] = None,
     threshold: float,
     no_self: bool = True,
+    stacked: bool = False,
 ) -> Set[Tuple[int, int]]:
-    """Find pairs of sets with Jaccard similarity above threshold using :func:`jaccard_similarity_scipy`.
+    """Find pairs of sets with Jaccard similarity above threshold.
+
+    For positive thresholds, :func:`jaccard_similarity_sparse` is used, which avoids materializing the full dense
+    similarity matrix. Otherwise, all pairs are candidates, and :func:`jaccard_similarity_scipy` is used.
 
     :param a:
         The first set.
@@ -198,20 +285,56 @@ def get_candidate_pairs(
         The threshold above which the similarity has to be.
     :param no_self:
         Whether to exclude (i, i) pairs.
+    :param stacked:
+        Whether the second set starts with the first set, cf. :func:`jaccard_similarity_sparse`.
 
     :return:
         A set of index pairs.
     """
-    if b is None:
-        b = a
     # duplicates
-    sim = jaccard_similarity_scipy(a, b)
+    if threshold > 0:
+        rows, cols = jaccard_similarity_sparse(a, b, threshold=threshold, stacked=stacked).nonzero()
+    else:
+        rows, cols = (jaccard_similarity_scipy(a, a if b is None else b) >= threshold).nonzero()
     if no_self:
         # we are not interested in self-similarity
-        num = sim.shape[0]
-        idx = numpy.arange(num)
-        sim[idx, idx] = 0
-    return set(zip(*(sim >= threshold).nonzero()))
+        mask = rows != cols
+        rows, cols = rows[mask], cols[mask]
+    return set(zip(rows, cols))
+
+
+def _get_candidate_duplicate_and_inverse_pairs(
+    rel: scipy.sparse.spmatrix,
+    inv: scipy.sparse.spmatrix,
+    threshold: float,
+) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]:
+    """Find candidate pairs of duplicate and inverse relations.
+
+    The result is the same as for ``get_candidate_pairs(a=rel, threshold=threshold)`` and
+    ``get_candidate_pairs(a=rel, b=inv, threshold=threshold)``, but the relations are compared against relations and
+    inverse relations in a single pass by stacking both. For the relation part, only the upper triangle is computed.
+
+    :param rel: shape: (num_relations, num_entity_pairs)
+        The head-tail-set matrix.
+    :param inv: shape: (num_relations, num_entity_pairs)
+        The tail-head-set matrix.
+    :param threshold:
+        The threshold above which the similarity has to be.
+
+    :return:
+        A pair of sets of candidate duplicate and candidate inverse relation pairs.
+    """
+    num_relations = rel.shape[0]
+    candidates = get_candidate_pairs(
+        a=rel,
+        b=scipy.sparse.vstack([rel, inv]),
+        threshold=threshold,
+        no_self=False,
+        stacked=True,
+    )
+    duplicates = {(a, b) for a, b in candidates if b < num_relations and a != b}
+    inverses = {(a, b - num_relations) for a, b in candidates if b >= num_relations and a != b - num_relations}
+    return duplicates, inverses
 
 
 class Sealant:
@@ -243,8 +366,10 @@ class Sealant:
         # compute similarities
         if symmetric:
             rel, inv = triples_factory_to_sparse_matrices(triples_factory=triples_factory)
-            self.candidate_duplicate_relations = get_candidate_pairs(a=rel, threshold=self.minimum_frequency)
-            self.candidate_inverse_relations = get_candidate_pairs(a=rel, b=inv, threshold=self.minimum_frequency)
+            (
+                self.candidate_duplicate_relations,
+                self.candidate_inverse_relations,
+            ) = _get_candidate_duplicate_and_inverse_pairs(rel=rel, inv=inv, threshold=self.minimum_frequency)
         else:
             raise NotImplementedError
         logger.info(
@@ -11,12 +11,15 @@ Later, this will be used to map the landscape and see if there is a smooth, cont
 relationship between datasets' splits' distances and their maximum performance.
 """
 
-from typing import List, Sequence
+from typing import List, Sequence, Set, Tuple
 
 import click
+import torch
 
 from .splitting import normalize_ratios, split
-from .triples_factory import CoreTriplesFactory, cat_triples
+from .triples_factory import CoreTriplesFactory, _splits_similarity_from_sets, cat_triples
+from .utils import triple_tensor_to_set
+from ..typing import MappedTriples
 
 __all__ = [
     "remix",
@@ -32,17 +35,25 @@ def remix(*triples_factories: CoreTriplesFactory, **kwargs) -> List[CoreTriplesF
 
     :raises NotImplementedError: if any of the triples factories have ``create_inverse_triples``
     """
+    all_triples, ratios = _prepare_remix(*triples_factories)
+    return _remix(triples_factories[0], all_triples, ratios, **kwargs)
+
+
+def _prepare_remix(*triples_factories: CoreTriplesFactory) -> Tuple[MappedTriples, Sequence[float]]:
+    """Compute the parts of the remix which do not depend on the random state, i.e., can be shared across trials."""
     for tf in triples_factories:
         if tf.create_inverse_triples:
             raise NotImplementedError("The remix algorithm is not implemented for datasets with inverse triples")
+    return cat_triples(*triples_factories), _get_ratios(*triples_factories)
 
-    all_triples = cat_triples(*triples_factories)
-    ratios = _get_ratios(*triples_factories)
 
-    return [
-        triples_factories[0].clone_and_exchange_triples(triples)
-        for triples in split(all_triples, ratios=ratios, **kwargs)
-    ]
+def _remix(
+    reference: CoreTriplesFactory,
+    all_triples: MappedTriples,
+    ratios: Sequence[float],
+    **kwargs,
+) -> List[CoreTriplesFactory]:
+    return [reference.clone_and_exchange_triples(triples) for triples in split(all_triples, ratios=ratios, **kwargs)]
 
 
 def _get_ratios(*triples_factories: CoreTriplesFactory) -> Sequence[float]:
@@ -51,10 +62,25 @@ def _get_ratios(*triples_factories: CoreTriplesFactory) -> Sequence[float]:
     return ratios
 
 
+def _get_remixed_training_set(
+    reference: CoreTriplesFactory,
+    all_triples: MappedTriples,
+    ratios: Sequence[float],
+    random_state: int,
+) -> Set[Tuple[int, ...]]:
+    # each trial gets its own generator, since seeding with an integer would (re-)seed the global generator, which is
+    # shared by all threads
+    training, *_ = _remix(reference, all_triples, ratios, random_state=torch.Generator().manual_seed(random_state))
+    return triple_tensor_to_set(training.mapped_triples)
+
+
 @click.command()
-@click.option("--trails", type=int, default=15, show_default=True)
+@click.option("--trials", type=int, default=15, show_default=True)
 def _main(trials):
+    import functools
     import itertools as itt
+    import os
+    from concurrent.futures import ThreadPoolExecutor
 
     import numpy as np
     from tqdm import tqdm
@@ -72,11 +98,24 @@ def _main(trials):
         "wn18",
     ]:
         reference_dataset = get_dataset(dataset=dataset_name)
-        remixed_datasets = [reference_dataset.remix(random_state=random_state) for random_state in range(trials)]
+        # the concatenated triples and the split ratios are the same for all trials, so compute them only once
+        triples_factories = reference_dataset._tup()
+        all_triples, ratios = _prepare_remix(*triples_factories)
+        num_triples = all_triples.shape[0]
+
+        # the trials are independent, and the heavy lifting in torch releases the GIL. Each trial's training triples
+        # are converted to a set once, rather than once per pair of trials, cf. splits_similarity
+        with ThreadPoolExecutor(max_workers=min(trials, os.cpu_count() or 1)) as executor:
+            training_sets = list(
+                executor.map(
+                    functools.partial(_get_remixed_training_set, triples_factories[0], all_triples, ratios),
+                    range(trials),
+                )
+            )
         similarities = [
-            a.similarity(b)
+            _splits_similarity_from_sets(a, b, num_triples=num_triples)
             for a, b in tqdm(
-                itt.combinations(remixed_datasets, r=2),
+                itt.combinations(training_sets, r=2),
                 total=n_comb,
                 desc=dataset_name,
             )
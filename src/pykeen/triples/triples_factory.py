@@ -19,6 +19,7 @@ from typing import (
     Sequence,
     Set,
     TextIO,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -1161,26 +1162,49 @@ def splits_steps(a: Sequence[CoreTriplesFactory], b: Sequence[CoreTriplesFactory
 
     :return: The number of triples present in the training sets in both
     """
+    return _splits_steps_from_sets(*_get_training_sets(a, b))
+
+
+def splits_similarity(a: Sequence[CoreTriplesFactory], b: Sequence[CoreTriplesFactory]) -> float:
+    """Compute the similarity between two datasets' splits.
+
+    :return: The number of triples present in the training sets in both
+    """
+    train_1, train_2 = _get_training_sets(a, b)
+    return _splits_similarity_from_sets(train_1, train_2, num_triples=sum(tf.num_triples for tf in a))
+
+
+def _get_training_sets(
+    a: Sequence[CoreTriplesFactory],
+    b: Sequence[CoreTriplesFactory],
+) -> Tuple[Set[Tuple[int, ...]], Set[Tuple[int, ...]]]:
     if len(a) != len(b):
         raise ValueError("Must have same number of triples factories")
 
-    train_1 = triple_tensor_to_set(a[0].mapped_triples)
-    train_2 = triple_tensor_to_set(b[0].mapped_triples)
-
     # FIXME currently the implementation does not consider the non-training (i.e., second-last entries)
     #  for the number of steps. Consider more interesting way to discuss splits w/ valid
 
+    return triple_tensor_to_set(a[0].mapped_triples), triple_tensor_to_set(b[0].mapped_triples)
+
+
+def _splits_steps_from_sets(train_1: Set[Tuple[int, ...]], train_2: Set[Tuple[int, ...]]) -> int:
+    """Compute the number of moves between two training sets, cf. :func:`splits_steps`."""
     return len(train_1.symmetric_difference(train_2))
 
 
-def splits_similarity(a: Sequence[CoreTriplesFactory], b: Sequence[CoreTriplesFactory]) -> float:
-    """Compute the similarity between two datasets' splits.
+def _splits_similarity_from_sets(
+    train_1: Set[Tuple[int, ...]],
+    train_2: Set[Tuple[int, ...]],
+    num_triples: int,
+) -> float:
+    """Compute the similarity between two training sets, cf. :func:`splits_similarity`.
 
-    :return: The number of triples present in the training sets in both
+    :param train_1: The first split's training triples
+    :param train_2: The second split's training triples
+    :param num_triples: The total number of triples of the dataset, i.e., over all splits
+    :return: The similarity
     """
-    steps = splits_steps(a, b)
-    n = sum(tf.num_triples for tf in a)
-    return 1 - steps / n
+    return 1 - _splits_steps_from_sets(train_1, train_2) / num_triples
 
 
 def normalize_path(path: Union[str, pathlib.Path, TextIO]) -> pathlib.Path:
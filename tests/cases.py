@@ -2,6 +2,7 @@
 
 """Test cases for PyKEEN."""
 
+import copy
 import logging
 import os
 import pathlib
@@ -40,7 +41,7 @@ import pykeen.models
 import pykeen.nn.message_passing
 import pykeen.nn.weighting
 from pykeen.datasets import Nations
-from pykeen.datasets.base import LazyDataset
+from pykeen.datasets.base import Dataset, LazyDataset
 from pykeen.datasets.kinships import KINSHIPS_TRAIN_PATH
 from pykeen.datasets.nations import NATIONS_TEST_PATH, NATIONS_TRAIN_PATH
 from pykeen.evaluation import Evaluator, MetricResults
@@ -77,6 +78,11 @@ class GenericTestCase(unittest_templates.GenericTestCase[T]):
         """Instantiate a generator for usage in the test case."""
         self.generator = set_random_seed(seed=42)[1]
 
+    def _pre_instantiation_hook(self, kwargs: MutableMapping[str, Any]) -> MutableMapping[str, Any]:  # noqa: D102
+        # the class-level kwargs are only copied shallowly; deep-copy them such that stateful arguments, e.g., the
+        # regularizers of a combined regularizer, are not shared between tests
+        return super()._pre_instantiation_hook(kwargs=copy.deepcopy(kwargs))
+
 
 class DatasetTestCase(unittest.TestCase):
     """A test case for quickly defining common tests for datasets."""
@@ -818,6 +824,9 @@ class ModelTestCase(unittest_templates.GenericTestCase[Model]):
     #: Additional arguments passed to the training loop's constructor method
     training_loop_kwargs: ClassVar[Optional[Mapping[str, Any]]] = None
 
+    #: The dataset, shared between all tests of the class
+    dataset: ClassVar[Dataset]
+
     #: The triples factory instance
     factory: TriplesFactory
 
@@ -849,14 +858,19 @@ class ModelTestCase(unittest_templates.GenericTestCase[Model]):
     #: Static extras to append to the CLI
     cli_extras: Sequence[str] = tuple()
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Load the dataset once, rather than for every single test."""
+        super().setUpClass()
+        cls.dataset = Nations(create_inverse_triples=cls.create_inverse_triples)
+
     def pre_setup_hook(self) -> None:  # noqa: D102
         # for reproducible testing
         _, self.generator, _ = set_random_seed(42)
 
     def _pre_instantiation_hook(self, kwargs: MutableMapping[str, Any]) -> MutableMapping[str, Any]:  # noqa: D102
         kwargs = super()._pre_instantiation_hook(kwargs=kwargs)
-        dataset = Nations(create_inverse_triples=self.create_inverse_triples)
-        self.factory = dataset.training
+        self.factory = self.dataset.training
         # insert shared parameters
         kwargs["triples_factory"] = self.factory
         kwargs["embedding_dim"] = self.embedding_dim
@@ -984,38 +998,29 @@ class ModelTestCase(unittest_templates.GenericTestCase[Model]):
         self._check_scores(batch, scores)
 
     @pytest.mark.slow
-    def test_train_slcwa(self) -> None:
-        """Test that sLCWA training does not fail."""
-        loop = SLCWATrainingLoop(
-            model=self.instance,
-            triples_factory=self.factory,
-            optimizer=Adagrad(params=self.instance.get_grad_params(), lr=0.001),
-            **(self.training_loop_kwargs or {}),
-        )
-        losses = self._safe_train_loop(
-            loop,
-            num_epochs=self.train_num_epochs,
-            batch_size=self.train_batch_size,
-            sampler=self.sampler,
-        )
-        self.assertIsInstance(losses, list)
-
-    @pytest.mark.slow
-    def test_train_lcwa(self) -> None:
-        """Test that LCWA training does not fail."""
-        loop = LCWATrainingLoop(
-            model=self.instance,
-            triples_factory=self.factory,
-            optimizer=Adagrad(params=self.instance.get_grad_params(), lr=0.001),
-            **(self.training_loop_kwargs or {}),
-        )
-        losses = self._safe_train_loop(
-            loop,
-            num_epochs=self.train_num_epochs,
-            batch_size=self.train_batch_size,
-            sampler="default",
-        )
-        self.assertIsInstance(losses, list)
+    def test_train(self) -> None:
+        """Test that sLCWA and LCWA training do not fail."""
+        # both training loops start from the same initial parameters, while sharing the model's set-up
+        initial_state = copy.deepcopy(self.instance.state_dict())
+        for training_loop_cls, sampler in (
+            (SLCWATrainingLoop, self.sampler),
+            (LCWATrainingLoop, "default"),
+        ):
+            with self.subTest(training_loop=training_loop_cls.__name__):
+                self.instance.load_state_dict(initial_state)
+                loop = training_loop_cls(
+                    model=self.instance,
+                    triples_factory=self.factory,
+                    optimizer=Adagrad(params=self.instance.get_grad_params(), lr=0.001),
+                    **(self.training_loop_kwargs or {}),
+                )
+                losses = self._safe_train_loop(
+                    loop,
+                    num_epochs=self.train_num_epochs,
+                    batch_size=self.train_batch_size,
+                    sampler=sampler,
+                )
+                self.assertIsInstance(losses, list)
 
     def _safe_train_loop(self, loop: TrainingLoop, num_epochs, batch_size, sampler):
         try:
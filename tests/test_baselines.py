@@ -2,13 +2,17 @@
 
 """Test non-parametric baseline models."""
 
+import unittest
 from typing import Any, MutableMapping
 
+import numpy
+import scipy.sparse
 import torch
 import unittest_templates
 
 from pykeen.datasets import Nations
 from pykeen.models import MarginalDistributionBaseline
+from pykeen.models.baseline.utils import get_csr_matrix, get_dense_rows
 
 
 class MarginalDistributionBaselineTests(unittest_templates.GenericTestCase[MarginalDistributionBaseline]):
@@ -32,6 +36,7 @@ class MarginalDistributionBaselineTests(unittest_templates.GenericTestCase[Margi
         hr_batch = self.factory.mapped_triples[torch.randint(self.factory.num_triples, size=(self.batch_size,))][:, :2]
         scores = self.instance.score_t(hr_batch=hr_batch)
         assert scores.shape == (self.batch_size, self.factory.num_entities)
+        assert scores.dtype == torch.float32
         # check probability distribution
         assert (0.0 <= scores).all() and (scores <= 1.0).all()
         assert torch.allclose(scores.sum(dim=1), torch.ones(self.batch_size))
@@ -41,6 +46,7 @@ class MarginalDistributionBaselineTests(unittest_templates.GenericTestCase[Margi
         rt_batch = self.factory.mapped_triples[torch.randint(self.factory.num_triples, size=(self.batch_size,))][:, 1:]
         scores = self.instance.score_h(rt_batch=rt_batch)
         assert scores.shape == (self.batch_size, self.factory.num_entities)
+        assert scores.dtype == torch.float32
         # check probability distribution
         assert (0.0 <= scores).all() and (scores <= 1.0).all()
         assert torch.allclose(scores.sum(dim=1), torch.ones(self.batch_size))
@@ -71,3 +77,36 @@ class TrivialMarginalDistributionBaselineTests(MarginalDistributionBaselineTests
         entity_margin=False,
         relation_margin=False,
     )
+
+
+class BaselineUtilsTests(unittest.TestCase):
+    """Tests for utilities of the non-parametric baseline models."""
+
+    def test_get_csr_matrix(self):
+        """Test get_csr_matrix against a COO-based reference."""
+        generator = numpy.random.default_rng(seed=42)
+        shape = (7, 11)
+        # draw more entries than rows to ensure duplicates and empty rows
+        row_indices = generator.integers(shape[0] - 1, size=50)
+        col_indices = generator.integers(shape[1], size=50)
+        matrix = get_csr_matrix(row_indices=row_indices, col_indices=col_indices, shape=shape)
+        assert isinstance(matrix, scipy.sparse.csr_matrix)
+        assert matrix.shape == shape
+        assert matrix.dtype == numpy.float32
+        assert matrix.indices.dtype == numpy.int32 and matrix.indptr.dtype == numpy.int32
+        counts = scipy.sparse.coo_matrix(
+            (numpy.ones_like(row_indices), (row_indices, col_indices)),
+            shape=shape,
+        ).toarray()
+        expected = counts / numpy.clip(counts.sum(axis=1, keepdims=True), a_min=1, a_max=None)
+        numpy.testing.assert_allclose(matrix.toarray(), expected, rtol=1.0e-06)
+
+    def test_get_dense_rows(self):
+        """Test get_dense_rows against plain row indexing."""
+        matrix = scipy.sparse.random(7, 11, density=0.3, format="csr", dtype=numpy.float32, random_state=42)
+        # contains repeated indices, and is not sorted
+        indices = numpy.asarray([3, 1, 3, 6, 0, 1, 3])
+        dense = get_dense_rows(matrix=matrix, indices=indices)
+        assert isinstance(dense, numpy.ndarray)
+        assert dense.dtype == numpy.float32
+        numpy.testing.assert_array_equal(dense, matrix[indices].toarray())
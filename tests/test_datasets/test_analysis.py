@@ -224,3 +224,11 @@ class DatasetAnalysisTests(unittest.TestCase):
 
         # check relation_id value range
         assert df[triple_analysis.RELATION_ID_COLUMN_NAME].isin(self.dataset.relation_to_id.values()).all()
+
+    def test_analysis_funcs(self):
+        """Test the registry of analysis functions used by the CLI."""
+        for key, func in dataset_analysis.ANALYSIS_FUNCS.items():
+            with self.subTest(key=key):
+                # keys are the function names without the get_ prefix and the _df suffix
+                self.assertEqual(f"get_{key}_df", func.__name__)
+                self.assertIs(func, getattr(dataset_analysis, func.__name__))
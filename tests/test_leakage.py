@@ -15,9 +15,11 @@ from pykeen.triples import TriplesFactory
 from pykeen.triples.leakage import (
     Sealant,
     _generate_compact_vectorized_lookup,
+    _get_candidate_duplicate_and_inverse_pairs,
     _translate_triples,
     get_candidate_pairs,
     jaccard_similarity_scipy,
+    jaccard_similarity_sparse,
     mapped_triples_to_sparse_matrices,
     triples_factory_to_sparse_matrices,
 )
@@ -206,6 +208,37 @@ class TestLeakage(unittest.TestCase):
         # check self-similarity = 1
         numpy.testing.assert_allclose(numpy.diag(sim), 1.0)
 
+    def test_jaccard_similarity_sparse(self):
+        """Test :func:`jaccard_similarity_sparse`."""
+        triples_factory = Nations().training
+        rel, inv = triples_factory_to_sparse_matrices(triples_factory)
+        threshold = 0.1
+        sim = jaccard_similarity_sparse(a=rel, b=inv, threshold=threshold, block_size=7)
+        # check type
+        assert isinstance(sim, scipy.sparse.csr_matrix)
+        # check shape
+        assert sim.shape == (triples_factory.num_relations, triples_factory.num_relations)
+        # check value range
+        assert (sim.data >= threshold).all()
+        assert (sim.data <= 1).all()
+        # check consistency with dense version
+        expected = jaccard_similarity_scipy(a=rel, b=inv)
+        expected[expected < threshold] = 0
+        numpy.testing.assert_allclose(sim.toarray(), expected)
+
+        # symmetric case, with multiple blocks
+        sim = jaccard_similarity_sparse(a=rel, b=None, threshold=threshold, block_size=7)
+        expected = jaccard_similarity_scipy(a=rel, b=rel)
+        expected[expected < threshold] = 0
+        numpy.testing.assert_allclose(sim.toarray(), expected)
+
+        # stacked case, i.e., symmetric for the first part, with multiple blocks
+        b = scipy.sparse.vstack([rel, inv])
+        sim = jaccard_similarity_sparse(a=rel, b=b, threshold=threshold, block_size=7, stacked=True)
+        expected = jaccard_similarity_scipy(a=rel, b=b)
+        expected[expected < threshold] = 0
+        numpy.testing.assert_allclose(sim.toarray(), expected)
+
     def test_candidate_pairs(self):
         """Test :func:`get_candidate_pairs`."""
         num_entities = 11
@@ -270,3 +303,12 @@ class TestLeakage(unittest.TestCase):
             (5, 2),
         }
         self.assertEqual(expected_candidate_pairs, candidate_pairs)
+
+    def test_candidate_duplicate_and_inverse_pairs(self):
+        """Test the fused search for candidate duplicate and inverse relations used by :class:`Sealant`."""
+        rel, inv = triples_factory_to_sparse_matrices(Nations().training)
+        for threshold in (0.1, 0.3, 0.5, 0.97):
+            with self.subTest(threshold=threshold):
+                duplicates, inverses = _get_candidate_duplicate_and_inverse_pairs(rel=rel, inv=inv, threshold=threshold)
+                self.assertEqual(get_candidate_pairs(a=rel, threshold=threshold), duplicates)
+                self.assertEqual(get_candidate_pairs(a=rel, b=inv, threshold=threshold), inverses)
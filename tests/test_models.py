@@ -80,19 +80,53 @@ class TestConvE(cases.ModelTestCase):
     """Test the ConvE model."""
 
     cls = pykeen.models.ConvE
-    embedding_dim = 12
+    # the smallest shapes which still yield a proper 2D convolution, i.e., (2*2 x 4) inputs and (2 x 2) kernels
+    embedding_dim = 8
     create_inverse_triples = True
     kwargs = {
-        "output_channels": 2,
-        "embedding_height": 3,
+        "output_channels": 1,
+        "embedding_height": 2,
         "embedding_width": 4,
+        "kernel_height": 2,
+        "kernel_width": 2,
     }
+    # the training tests only check that training runs through, i.e., the shapes are compatible; for this, a single
+    # epoch suffices. Notice that we cannot use a batch size of 1, since batch normalization needs more than one sample
+    train_num_epochs = 1
     # 3x batch norm: bias + scale --> 6
     # entity specific bias        --> 1
     # ==================================
     #                                 7
     num_constant_init = 7
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Run on a single thread; for the tiny convolutions, multi-threading only adds overhead."""
+        super().setUpClass()
+        cls._num_threads = torch.get_num_threads()
+        torch.set_num_threads(1)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Restore the number of threads."""
+        torch.set_num_threads(cls._num_threads)
+        super().tearDownClass()
+
+    def _pre_instantiation_hook(self, kwargs: MutableMapping[str, Any]) -> MutableMapping[str, Any]:  # noqa: D102
+        kwargs = super()._pre_instantiation_hook(kwargs=kwargs)
+        # pin to CPU, which avoids CUDA initialization and cuDNN's algorithm search
+        kwargs["preferred_device"] = "cpu"
+        return kwargs
+
+    def test_convolution_shape(self):
+        """Test that the convolution's output shape matches the configured (small) shapes."""
+        height, width = self.kwargs["embedding_height"], self.kwargs["embedding_width"]
+        x = torch.rand(self.batch_size, 1, height, width, generator=self.generator).to(self.instance.device)
+        y = self.instance._convolve_entity_relation(h=x, r=x)
+        self.assertEqual((self.batch_size, self.embedding_dim), tuple(y.shape))
+        # (2 * 2 - 2 + 1) * (4 - 2 + 1) features after the convolution
+        self.assertEqual(9, self.instance.fc.in_features)
+
 
 class TestConvKB(cases.ModelTestCase):
     """Test the ConvKB model."""